@@ -9,6 +9,7 @@ from typing import (
     List,
     Optional,
     Sequence,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -1592,6 +1593,7 @@ class Esmerald(Starlette):
         self.tags = self.load_settings_value("tags", tags)
 
         self.openapi_schema: Optional["OpenAPI"] = None
+        self._openapi_cache: Optional[Tuple[Any, Tuple[Any, ...], bytes]] = None
         self.state: Annotated[
             State,
             Doc(
@@ -1746,6 +1748,9 @@ class Esmerald(Starlette):
             if value or not getattr(self.openapi_config, name, None):
                 setattr(self.openapi_config, name, value)
 
+        # The route table changed, the schema is built again on the next hit.
+        self.openapi_schema = None
+
         if self.enable_openapi:
             set_value(self.title, "title")
             set_value(self.version, "version")
@@ -1,9 +1,11 @@
-from typing import Any, Dict, List, Optional, Sequence, Union
+from typing import Any, Dict, List, Optional, Sequence, Union, cast
 
 from openapi_schemas_pydantic.v3_1_0.security_scheme import SecurityScheme
+from orjson import loads
 from pydantic import AnyUrl, BaseModel
 from typing_extensions import Annotated, Doc
 
+from esmerald.enums import MediaType
 from esmerald.openapi.docs import (
     get_redoc_html,
     get_stoplight_html,
@@ -11,9 +13,9 @@ from esmerald.openapi.docs import (
     get_swagger_ui_oauth2_redirect_html,
 )
 from esmerald.openapi.models import Contact, License
-from esmerald.openapi.openapi import get_openapi
+from esmerald.openapi.openapi import get_openapi, get_openapi_bytes
 from esmerald.requests import Request
-from esmerald.responses import HTMLResponse, JSONResponse
+from esmerald.responses import HTMLResponse, StarletteResponse
 from esmerald.routing.handlers import get
 
 
@@ -327,26 +329,57 @@ class OpenAPIConfig(BaseModel):
         ),
     ] = None
 
+    def get_openapi_arguments(self, app: Any) -> Dict[str, Any]:
+        """The arguments used to build the OpenAPI routing schema of the app"""
+        return {
+            "app": app,
+            "title": self.title,
+            "version": self.version,
+            "openapi_version": self.openapi_version,
+            "summary": self.summary,
+            "description": self.description,
+            "routes": app.routes,
+            "tags": self.tags,
+            "servers": self.servers,
+            "terms_of_service": self.terms_of_service,
+            "contact": self.contact,
+            "license": self.license,
+            "webhooks": self.webhooks,
+        }
+
     def openapi(self, app: Any) -> Dict[str, Any]:
         """Loads the OpenAPI routing schema"""
-        openapi_schema = get_openapi(
-            app=app,
-            title=self.title,
-            version=self.version,
-            openapi_version=self.openapi_version,
-            summary=self.summary,
-            description=self.description,
-            routes=app.routes,
-            tags=self.tags,
-            servers=self.servers,
-            terms_of_service=self.terms_of_service,
-            contact=self.contact,
-            license=self.license,
-            webhooks=self.webhooks,
-        )
+        openapi_schema = get_openapi(**self.get_openapi_arguments(app))
         app.openapi_schema = openapi_schema
         return app.openapi_schema
 
+    def openapi_json(self, app: Any) -> bytes:
+        """
+        Loads the OpenAPI routing schema serialized in JSON.
+
+        The schema is built and serialized once and kept in `app.openapi_schema`.
+        It is built again when `app.openapi_schema` is set to `None`, which
+        `activate_openapi` does, or when the routes or webhooks of the application
+        are not the same objects anymore. Changes made inside the nested routers
+        are only picked up through the application methods.
+        """
+        arguments = self.get_openapi_arguments(app)
+        routes = (*arguments["routes"], *(arguments["webhooks"] or []))
+
+        cache = getattr(app, "_openapi_cache", None)
+        if (
+            cache is not None
+            and app.openapi_schema is cache[0]
+            and len(routes) == len(cache[1])
+            and all(route is cached for route, cached in zip(routes, cache[1]))
+        ):
+            return cast(bytes, cache[2])
+
+        content = get_openapi_bytes(**arguments)
+        app.openapi_schema = loads(content)
+        app._openapi_cache = (app.openapi_schema, routes, content)
+        return content
+
     def enable(self, app: Any) -> None:
         """Enables the OpenAPI documentation"""
         if self.openapi_url:
@@ -354,14 +387,15 @@ class OpenAPIConfig(BaseModel):
             server_urls = set(urls)
 
             @get(path=self.openapi_url)  # type: ignore
-            async def _openapi(request: Request) -> JSONResponse:
+            async def _openapi(request: Request) -> StarletteResponse:
                 root_path = request.scope.get("root_path", "").rstrip("/")
 
                 if root_path not in server_urls:
                     if root_path and self.root_path_in_servers:
                         self.servers.insert(0, {"url": root_path})
                         server_urls.add(root_path)
-                return JSONResponse(self.openapi(app))
+                        app.openapi_schema = None
+                return StarletteResponse(self.openapi_json(app), media_type=MediaType.JSON)
 
             app.add_route(
                 path="/",
@@ -1,13 +1,26 @@
 import http.client
 import inspect
-import json
 import warnings
-from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, Union, cast
+from enum import Enum
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
-from orjson import loads
-from pydantic import AnyUrl
+from orjson import dumps, loads
+from pydantic import AnyUrl, BaseModel
 from pydantic.fields import FieldInfo
 from pydantic.json_schema import GenerateJsonSchema, JsonSchemaValue
+from pydantic_core import to_jsonable_python
 from starlette.middleware import Middleware
 from starlette.routing import BaseRoute
 from starlette.status import HTTP_422_UNPROCESSABLE_ENTITY
@@ -30,6 +43,7 @@ from esmerald.openapi.utils import (
     VALIDATION_ERROR_DEFINITION,
     VALIDATION_ERROR_RESPONSE_DEFINITION,
     dict_update,
+    dumps_example,
     get_definitions,
     get_schema_from_model_field,
     is_status_code_allowed,
@@ -37,37 +51,78 @@ from esmerald.openapi.utils import (
 from esmerald.params import Param
 from esmerald.routing import gateways, router
 from esmerald.typing import Undefined
-from esmerald.utils.constants import DATA, PAYLOAD
 from esmerald.utils.helpers import is_class_and_subclass
 from esmerald.utils.url import clean_path
 
 
 def get_flat_params(route: Union[router.HTTPHandler, Any]) -> List[Any]:
-    """Gets all the neded params of the request and route"""
-    path_params = [param.field_info for param in route.transformer.get_path_params()]
-    cookie_params = [param.field_info for param in route.transformer.get_cookie_params()]
-    query_params = [param.field_info for param in route.transformer.get_query_params()]
-    header_params = [param.field_info for param in route.transformer.get_header_params()]
+    """
+    Gets all the neded params of the request and route.
+
+    The result is cached in the handler and only recomputed if the transformer
+    of the handler changes.
+    """
+    transformer = route.transformer
+    cached = getattr(route, "_flat_params", None)
+    if cached is not None and cached[0] is transformer:
+        return cast(List[Any], cached[1])
 
-    return path_params + query_params + cookie_params + header_params
+    flat_params = _get_flat_params(route)
+    route._flat_params = (transformer, flat_params)
+    return flat_params
 
 
-def get_openapi_security_schemes(schemes: Any) -> Tuple[dict, list]:
+def _get_flat_params(route: Union[router.HTTPHandler, Any]) -> List[Any]:
+    path_params, query_params, cookie_params, header_params = route.transformer.get_all_params()
+    return [
+        param.field_info for param in (*path_params, *query_params, *cookie_params, *header_params)
+    ]
+
+
+def get_openapi_security_schemes(
+    schemes: Any, security_cache: Optional[Dict[Any, Tuple[SecurityScheme, dict]]] = None
+) -> Tuple[dict, list]:
     """
     Builds the security schemas for OpenAPI.
+
+    The `security_cache` allows sharing the instantiated and dumped schemes between
+    the handlers of the same OpenAPI build, since the schemes are usually declared
+    once and used by many handlers.
     """
     security_definitions = {}
     operation_security = []
 
+    if security_cache is None:
+        security_cache = {}
+
     for security_requirement in schemes:
-        if inspect.isclass(security_requirement):
-            security_requirement = security_requirement()
+        # The classes are hashable, the instances are tracked by identity
+        # and are kept alive by the handlers during the build.
+        cache_key = (
+            security_requirement
+            if inspect.isclass(security_requirement)
+            else id(security_requirement)
+        )
+        cached = security_cache.get(cache_key)
+
+        if cached is None:
+            if inspect.isclass(security_requirement):
+                security_requirement = security_requirement()
 
-        if not isinstance(security_requirement, SecurityScheme):
-            raise ValueError(
-                "Security schemes must subclass from `esmerald.openapi.models.SecurityScheme`"
+            if not isinstance(security_requirement, SecurityScheme):
+                raise ValueError(
+                    "Security schemes must subclass from `esmerald.openapi.models.SecurityScheme`"
+                )
+            # The scheme name is the key of the definition, not one of its fields
+            cached = (
+                security_requirement,
+                security_requirement.model_dump(
+                    by_alias=True, exclude_none=True, exclude={"scheme_name"}
+                ),
             )
-        security_definition = security_requirement.model_dump(by_alias=True, exclude_none=True)
+            security_cache[cache_key] = cached
+
+        security_requirement, security_definition = cached
         security_name = security_requirement.scheme_name
         security_definitions[security_name] = security_definition
         operation_security.append({security_name: security_requirement})
@@ -82,25 +137,24 @@ def get_fields_from_routes(
     body_fields: List[FieldInfo] = []
     response_from_routes: List[FieldInfo] = []
 
-    if not request_fields:
+    if request_fields is None:
         request_fields = []
 
     for route in routes:
-        if getattr(route, "include_in_schema", None) and isinstance(route, router.Include):
-            request_fields.extend(get_fields_from_routes(route.routes, request_fields))
+        if not getattr(route, "include_in_schema", None):
             continue
 
-        if getattr(route, "include_in_schema", None) and isinstance(
-            route, (gateways.Gateway, gateways.WebhookGateway)
-        ):
+        if isinstance(route, router.Include):
+            request_fields.extend(get_fields_from_routes(route.routes))
+            continue
+
+        if isinstance(route, (gateways.Gateway, gateways.WebhookGateway)):
             handler = cast(router.HTTPHandler, route.handler)
 
-            # Get the data_field
-            if (
-                DATA in handler.signature_model.model_fields
-                or PAYLOAD in handler.signature_model.model_fields
-            ):
-                data_field = handler.data_field
+            # Get the data_field, cached in the handler and only set
+            # if the handler declares a data or payload.
+            data_field = handler.data_field
+            if data_field is not None:
                 body_fields.append(data_field)
 
             if handler.response_models:
@@ -112,11 +166,30 @@ def get_fields_from_routes(
             if params:
                 request_fields.extend(params)
 
-    return list(body_fields + response_from_routes + request_fields)
+    return body_fields + response_from_routes + request_fields
 
 
-def get_openapi_operation(
+def check_operation_id(
     *, route: Union[router.HTTPHandler, Any], operation_ids: Set[str]
+) -> None:  # pragma: no cover
+    """
+    Registers the operation id of the handler and warns if it was already
+    used by another handler.
+    """
+    operation_id = route.operation_id
+    if operation_id in operation_ids:
+        message = (
+            f"Duplicate Operation ID {operation_id} for function " + f"{route.endpoint.__name__}"
+        )
+        file_name = getattr(route.endpoint, "__globals__", {}).get("__file__")
+        if file_name:
+            message += f" at {file_name}"
+        warnings.warn(message, stacklevel=1)
+    operation_ids.add(operation_id)
+
+
+def get_openapi_operation(
+    *, route: Union[router.HTTPHandler, Any]
 ) -> Dict[str, Any]:  # pragma: no cover
     operation = Operation()
     operation.tags = route.get_handler_tags()
@@ -129,18 +202,7 @@ def get_openapi_operation(
     if route.description:
         operation.description = route.description
 
-    operation_id = route.operation_id
-    if operation_id in operation_ids:
-        message = (
-            f"Duplicate Operation ID {operation_id} for function " + f"{route.endpoint.__name__}"
-        )
-        file_name = getattr(route.endpoint, "__globals__", {}).get("__file__")
-        if file_name:
-            message += f" at {file_name}"
-        warnings.warn(message, stacklevel=1)
-    operation_ids.add(operation_id)
-
-    operation.operationId = operation_id
+    operation.operationId = route.operation_id
     if route.deprecated:
         operation.deprecated = route.deprecated
 
@@ -176,7 +238,7 @@ def get_openapi_operation_parameters(
         if field_info.description:
             parameter.description = field_info.description
         if field_info.examples is not None:
-            parameter.example = json.dumps(field_info.examples)
+            parameter.example = dumps_example(field_info.examples)
         if field_info.deprecated:
             parameter.deprecated = field_info.deprecated
 
@@ -206,7 +268,7 @@ def get_openapi_operation_request_body(
 
     request_media_content: Dict[str, Any] = {"schema": schema}
     if field_info.examples is not None:
-        request_media_content["example"] = json.dumps(field_info.examples)
+        request_media_content["example"] = dumps_example(field_info.examples)
     request_data_oai["content"] = {request_media_type: request_media_content}
     return request_data_oai
 
@@ -217,6 +279,7 @@ def get_openapi_path(
     operation_ids: Set[str],
     field_mapping: Dict[Tuple[FieldInfo, Literal["validation", "serialization"]], JsonSchemaValue],
     is_deprecated: bool = False,
+    security_cache: Optional[Dict[Any, Tuple[SecurityScheme, dict]]] = None,
 ) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:  # pragma: no cover
     path: Dict[str, Any] = {}
     security_schemes: Dict[str, Any] = {}
@@ -235,57 +298,64 @@ def get_openapi_path(
         ), "`media_type` is required in the response class."
         route_response_media_type = handler.response_class.media_type
 
+    # The media type is used as a key of the contents, enums are not valid JSON keys
+    if isinstance(route_response_media_type, Enum):
+        route_response_media_type = route_response_media_type.value
+
     # If routes do not want to be included in the schema generation
     if not route.include_in_schema or not handler.include_in_schema:
         return path, security_schemes, definitions
 
+    # Everything that does not depend on the method is computed only once
+    security_definitions, operation_security = get_openapi_security_schemes(
+        handler.get_security_schemes(), security_cache=security_cache
+    )
+    if security_definitions:
+        security_schemes.update(security_definitions)
+
+    all_route_params = get_flat_params(handler)
+    parameters = get_openapi_operation_parameters(
+        all_route_params=all_route_params,
+        field_mapping=field_mapping,
+    )
+    if parameters:
+        # Deduplicates the parameters, the required ones take precedence
+        all_parameters: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for param in parameters:
+            key = (param["in"], param["name"])
+            if param.get("required") or not all_parameters.get(key, {}).get("required"):
+                all_parameters[key] = param
+        parameters = list(all_parameters.values())
+
+    request_data_oai: Optional[Dict[str, Any]] = None
+    if not METHODS_WITH_BODY.isdisjoint(handler.methods):
+        request_data_oai = get_openapi_operation_request_body(
+            data_field=handler.data_field,
+            field_mapping=field_mapping,
+        )
+
+    status_code = str(handler.status_code)
+
+    # The operation id is the same for every method of the handler
+    check_operation_id(route=handler, operation_ids=operation_ids)
+
     # For each method
     for method in route.handler.methods:
-        operation = get_openapi_operation(route=handler, operation_ids=operation_ids)
+        operation = get_openapi_operation(route=handler)
         # If the parent if marked as deprecated, it takes precedence
         if is_deprecated or route.deprecated:
             operation["deprecated"] = is_deprecated if is_deprecated else route.deprecated
 
-        parameters: List[Dict[str, Any]] = []
-        security_definitions, operation_security = get_openapi_security_schemes(
-            handler.get_security_schemes()
-        )
-
         if operation_security:
             operation.setdefault("security", []).extend(operation_security)
 
-        if security_definitions:
-            security_schemes.update(security_definitions)
-
-        all_route_params = get_flat_params(handler)
-        operation_parameters = get_openapi_operation_parameters(
-            all_route_params=all_route_params,
-            field_mapping=field_mapping,
-        )
-        parameters.extend(operation_parameters)
-
         if parameters:
-            all_parameters = {(param["in"], param["name"]): param for param in parameters}
-            required_parameters = {
-                (param["in"], param["name"]): param
-                for param in parameters
-                if param.get("required")
-            }
-            all_parameters.update(required_parameters)
-            operation["parameters"] = list(all_parameters.values())
+            operation["parameters"] = parameters
 
-        if method in METHODS_WITH_BODY:
-            request_data_oai = get_openapi_operation_request_body(
-                data_field=handler.data_field,
-                field_mapping=field_mapping,
-            )
-            if request_data_oai:
-                operation["requestBody"] = request_data_oai
+        if request_data_oai and method in METHODS_WITH_BODY:
+            operation["requestBody"] = request_data_oai
 
-        status_code = str(handler.status_code)
-        operation.setdefault("responses", {}).setdefault(status_code, {})[
-            "description"
-        ] = handler.response_description
+        responses: Dict[str, Any] = {status_code: {"description": handler.response_description}}
 
         # Media type
         if route_response_media_type and is_status_code_allowed(handler.status_code):
@@ -293,37 +363,32 @@ def get_openapi_path(
                 {"type": "string"} if handler.status_code not in handler.responses else {}
             )
 
-            operation.setdefault("responses", {}).setdefault(status_code, {}).setdefault(
-                "content", {}
-            ).setdefault(route_response_media_type, {})["schema"] = response_schema
+            responses[status_code]["content"] = {
+                route_response_media_type: {"schema": response_schema}
+            }
 
         # Additional responses
         if handler.response_models:
-            operation_responses = operation.setdefault("responses", {})
             for additional_status_code, _ in handler.response_models.items():
-                process_response = handler.responses[additional_status_code].model_copy()
+                process_response = handler.responses[additional_status_code]
                 status_code_key = str(additional_status_code).upper()
 
                 if status_code_key == "DEFAULT":
                     status_code_key = "default"
 
-                openapi_response = operation_responses.setdefault(status_code_key, {})
+                openapi_response = responses.setdefault(status_code_key, {})
 
                 field = handler.response_models.get(additional_status_code)
-                additional_field_schema: Optional[Dict[str, Any]] = None
-                model_schema = process_response.model_json_schema()
+                model_schema: Dict[str, Any] = {}
 
                 if field:
                     additional_field_schema = get_schema_from_model_field(
                         field=field, field_mapping=field_mapping
                     )
                     media_type = route_response_media_type or MediaType.JSON.value
-                    additional_schema = (
-                        model_schema.setdefault("content", {})
-                        .setdefault(media_type, {})
-                        .setdefault("schema", {})
-                    )
-                    dict_update(additional_schema, additional_field_schema)
+                    model_schema["content"] = {
+                        media_type: {"schema": dict(additional_field_schema)}
+                    }
 
                 # status
                 status_text = (
@@ -340,11 +405,13 @@ def get_openapi_path(
                 dict_update(openapi_response, model_schema)
                 openapi_response["description"] = description
 
+        operation["responses"] = responses
+
         http422 = str(HTTP_422_UNPROCESSABLE_ENTITY)
         if (all_route_params or handler.data_field) and not any(
-            status in operation["responses"] for status in {http422, "4XX", "default"}
+            status in responses for status in {http422, "4XX", "default"}
         ):
-            operation["responses"][http422] = {
+            responses[http422] = {
                 "description": "Validation Error",
                 "content": {
                     "application/json": {"schema": {"$ref": REF_PREFIX + "HTTPValidationError"}}
@@ -361,6 +428,24 @@ def get_openapi_path(
     return path, security_schemes, definitions
 
 
+def get_openapi_route_path(
+    route: Union[gateways.Gateway, gateways.WebhookGateway], prefix: str
+) -> str:
+    """
+    Returns the OpenAPI path of a gateway under the given prefix.
+
+    The path is cached in the gateway together with the prefix used to compute it,
+    so it is only recomputed if the same gateway is reached with another prefix.
+    """
+    cached = getattr(route, "_openapi_path", None)
+    if cached is not None and cached[0] == prefix:
+        return cast(str, cached[1])
+
+    route_path = clean_path(prefix + route.path_format)
+    route._openapi_path = (prefix, route_path)
+    return route_path
+
+
 def should_include_in_schema(route: router.Include) -> bool:
     """
     Checks if a specifc object should be included in the schema
@@ -402,7 +487,32 @@ def is_middleware_app(route: router.Include) -> bool:
     return bool(isinstance(route.app, (Middleware, MiddlewareProtocol)))
 
 
-def get_openapi(
+def clean_none_values(value: Any) -> Any:
+    """
+    Recursively removes the `None` values from the dictionaries, mimicking the
+    `exclude_none=True` of pydantic, and converts the rest into JSON native values.
+
+    Any pydantic model found is dumped, the enums (keys or values) are replaced by
+    their values and any other non native value is converted by pydantic.
+    """
+    if isinstance(value, dict):
+        return {
+            (key.value if isinstance(key, Enum) else key): clean_none_values(item)
+            for key, item in value.items()
+            if item is not None
+        }
+    if isinstance(value, (list, tuple)):
+        return [clean_none_values(item) for item in value]
+    if isinstance(value, BaseModel):
+        return value.model_dump(by_alias=True, exclude_none=True, mode="json")
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (str, int, float, bool)):
+        return value
+    return to_jsonable_python(value)
+
+
+def build_openapi(
     *,
     app: Any,
     title: str,
@@ -417,9 +527,14 @@ def get_openapi(
     contact: Optional[Contact] = None,
     license: Optional[License] = None,
     webhooks: Optional[Sequence[BaseRoute]] = None,
+    schema_generator_class: Type[GenerateJsonSchema] = GenerateJsonSchema,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
-    Builds the whole OpenAPI route structure and object
+    Builds the whole OpenAPI route structure as plain dictionaries, before
+    any validation.
+
+    The `schema_generator_class` is instantiated once per call since a pydantic
+    schema generator can only be used once.
     """
     from esmerald import ChildEsmerald, Esmerald
 
@@ -437,7 +552,7 @@ def get_openapi(
 
     output: Dict[str, Any] = {
         "openapi": openapi_version,
-        "info": info.model_dump(exclude_none=True, by_alias=True),
+        "info": info.model_dump(exclude_none=True, by_alias=True, mode="json"),
     }
 
     if servers:
@@ -447,96 +562,76 @@ def get_openapi(
     paths: Dict[str, Dict[str, Any]] = {}
     webhooks_paths: Dict[str, Dict[str, Any]] = {}
     operation_ids: Set[str] = set()
+    security_cache: Dict[Any, Tuple[SecurityScheme, dict]] = {}
     all_fields = get_fields_from_routes(list(routes or []) + list(webhooks or []))
-    schema_generator = GenerateJsonSchema(ref_template=REF_TEMPLATE)
+    schema_generator = schema_generator_class(ref_template=REF_TEMPLATE)
     field_mapping, definitions = get_definitions(
         fields=all_fields,
         schema_generator=schema_generator,
     )
 
-    # Iterate through the routes
-    def iterate_routes(
-        app: Any,
-        routes: Sequence[BaseRoute],
-        definitions: Any = None,
-        components: Any = None,
-        prefix: Optional[str] = "",
-        is_webhook: bool = False,
-        is_deprecated: bool = False,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
-        for route in routes:
-            if app.router.deprecated:
-                is_deprecated = True
-
-            if isinstance(route, router.Include):
-                if hasattr(route, "app"):
-                    if not should_include_in_schema(route):
-                        continue
-
-                # For external middlewares
-                if getattr(route.app, "routes", None) is None and not is_middleware_app(route):
-                    continue
+    # Iterate through the routes and webhooks using an explicit stack of
+    # (routes, prefix, is_deprecated, is_webhook), keeping the routes order.
+    is_app_deprecated = bool(app.router.deprecated)
+    stack: List[Tuple[Iterator[BaseRoute], str, bool, bool]] = [
+        (iter(webhooks or []), "", is_app_deprecated, True),
+        (iter(routes or []), "", is_app_deprecated, False),
+    ]
+
+    while stack:
+        routes_iterator, prefix, is_deprecated, is_webhook = stack[-1]
+        route = next(routes_iterator, None)
+        if route is None:
+            stack.pop()
+            continue
 
-                if hasattr(route, "app") and isinstance(route.app, (Esmerald, ChildEsmerald)):
-                    route_path = clean_path(prefix + route.path)
+        if isinstance(route, router.Include):
+            if hasattr(route, "app"):
+                if not should_include_in_schema(route):
+                    continue
 
-                    definitions, components = iterate_routes(
-                        app,
-                        route.app.routes,
-                        definitions,
-                        components,
-                        prefix=route_path,
-                        is_deprecated=is_deprecated if is_deprecated else route.deprecated,
-                    )
-                else:
-                    route_path = clean_path(prefix + route.path)
-                    definitions, components = iterate_routes(
-                        app,
-                        route.routes,
-                        definitions,
-                        components,
-                        prefix=route_path,
-                        is_deprecated=is_deprecated if is_deprecated else route.deprecated,
-                    )
+            # For external middlewares
+            if getattr(route.app, "routes", None) is None and not is_middleware_app(route):
                 continue
 
-            if isinstance(route, (gateways.Gateway, gateways.WebhookGateway)):
-                result = get_openapi_path(
-                    route=route,
-                    operation_ids=operation_ids,
-                    field_mapping=field_mapping,
-                    is_deprecated=is_deprecated,
+            if hasattr(route, "app") and isinstance(route.app, (Esmerald, ChildEsmerald)):
+                child_routes = route.app.routes
+            else:
+                child_routes = route.routes
+
+            stack.append(
+                (
+                    iter(child_routes),
+                    clean_path(prefix + route.path),
+                    is_deprecated if is_deprecated else route.deprecated,
+                    False,
                 )
-                if result:
-                    path, security_schemes, path_definitions = result
-                    if path:
-                        if is_webhook:
-                            webhooks_paths.setdefault(route.path, {}).update(path)
-                        else:
-                            route_path = clean_path(prefix + route.path_format)
-                            paths.setdefault(route_path, {}).update(path)
-                    if security_schemes:
-                        components.setdefault("securitySchemes", {}).update(security_schemes)
-                    if path_definitions:
-                        definitions.update(path_definitions)
-
-        return definitions, components
-
-    definitions, components = iterate_routes(
-        app=app, routes=routes, definitions=definitions, components=components
-    )
+            )
+            continue
 
-    if webhooks:
-        definitions, components = iterate_routes(
-            app=app,
-            routes=webhooks,
-            definitions=definitions,
-            components=components,
-            is_webhook=True,
-        )
+        if isinstance(route, (gateways.Gateway, gateways.WebhookGateway)):
+            result = get_openapi_path(
+                route=route,
+                operation_ids=operation_ids,
+                field_mapping=field_mapping,
+                is_deprecated=is_deprecated,
+                security_cache=security_cache,
+            )
+            if result:
+                path, security_schemes, path_definitions = result
+                if path:
+                    if is_webhook:
+                        webhooks_paths.setdefault(route.path, {}).update(path)
+                    else:
+                        route_path = get_openapi_route_path(route, prefix)
+                        paths.setdefault(route_path, {}).update(path)
+                if security_schemes:
+                    components.setdefault("securitySchemes", {}).update(security_schemes)
+                if path_definitions:
+                    definitions.update(path_definitions)
 
     if definitions:
-        components["schemas"] = {k: definitions[k] for k in sorted(definitions)}
+        components["schemas"] = dict(sorted(definitions.items()))
     if components:
         output["components"] = components
     output["paths"] = paths
@@ -545,6 +640,72 @@ def get_openapi(
     if tags:
         output["tags"] = tags
 
-    openapi = OpenAPI(**output)
-    model_dump = openapi.model_dump_json(by_alias=True, exclude_none=True)
-    return cast(Dict[str, Any], loads(model_dump))
+    return output
+
+
+def get_openapi(
+    *,
+    app: Any,
+    title: str,
+    version: str,
+    openapi_version: str = "3.1.0",
+    summary: Optional[str] = None,
+    description: Optional[str] = None,
+    routes: Sequence[BaseRoute],
+    tags: Optional[List[str]] = None,
+    servers: Optional[List[Dict[str, Union[str, Any]]]] = None,
+    terms_of_service: Optional[Union[str, AnyUrl]] = None,
+    contact: Optional[Contact] = None,
+    license: Optional[License] = None,
+    webhooks: Optional[Sequence[BaseRoute]] = None,
+    validate: bool = True,
+    schema_generator_class: Type[GenerateJsonSchema] = GenerateJsonSchema,
+) -> Dict[str, Any]:  # pragma: no cover
+    """
+    Builds the whole OpenAPI route structure and object.
+
+    When `validate` is `False`, the structure is returned as a plain dictionary
+    without being validated and serialized by the `OpenAPI` model.
+    """
+    output = build_openapi(
+        app=app,
+        title=title,
+        version=version,
+        openapi_version=openapi_version,
+        summary=summary,
+        description=description,
+        routes=routes,
+        tags=tags,
+        servers=servers,
+        terms_of_service=terms_of_service,
+        contact=contact,
+        license=license,
+        webhooks=webhooks,
+        schema_generator_class=schema_generator_class,
+    )
+    if not validate:
+        return cast(Dict[str, Any], clean_none_values(output))
+    return cast(Dict[str, Any], loads(serialize_openapi(output)))
+
+
+def get_openapi_bytes(*, validate: bool = True, **kwargs: Any) -> bytes:  # pragma: no cover
+    """
+    Builds the whole OpenAPI route structure, like `get_openapi`, directly
+    serialized in JSON.
+
+    The keyword arguments are the ones of `get_openapi`. Avoids loading the
+    serialized document back into a dictionary when it is only going to be
+    sent in a response.
+    """
+    output = build_openapi(**kwargs)
+    if not validate:
+        return dumps(clean_none_values(output))
+    return serialize_openapi(output)
+
+
+def serialize_openapi(output: Dict[str, Any]) -> bytes:
+    """
+    Validates the OpenAPI structure with the `OpenAPI` model and serializes it in JSON.
+    """
+    openapi = OpenAPI.model_validate(output)
+    return openapi.model_dump_json(by_alias=True, exclude_none=True).encode("utf-8")
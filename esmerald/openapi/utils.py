@@ -1,6 +1,8 @@
+import json
 from typing import Any, Dict, List, Tuple, Union
 
 import msgspec
+from orjson import dumps
 from pydantic import TypeAdapter
 from pydantic.fields import FieldInfo
 from pydantic.json_schema import GenerateJsonSchema, JsonSchemaValue
@@ -90,6 +92,19 @@ def get_schema_from_model_field(
     return json_schema
 
 
+def dumps_example(example: Any) -> str:
+    """
+    Serializes the examples of a field into a JSON string.
+
+    Uses orjson and falls back to the standard library for the values orjson
+    does not support, using the same compact format.
+    """
+    try:
+        return dumps(example).decode("utf-8")
+    except TypeError:
+        return json.dumps(example, separators=(",", ":"))
+
+
 def is_status_code_allowed(status_code: Union[int, str, None]) -> bool:
     if status_code is None:
         return True
@@ -107,6 +122,11 @@ def is_status_code_allowed(status_code: Union[int, str, None]) -> bool:
 def dict_update(
     original_dict: Dict[Any, Any], update_dict: Dict[Any, Any]
 ) -> None:  # pragma: no cover
+    # Nothing to merge, the keys can be copied at once
+    if original_dict.keys().isdisjoint(update_dict):
+        original_dict.update(update_dict)
+        return
+
     for key, value in update_dict.items():
         if (
             key in original_dict
@@ -1,5 +1,5 @@
 import re
-from typing import TYPE_CHECKING, Any, Callable, List, Optional, Sequence, Union, cast
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Sequence, Tuple, Union, cast
 
 from starlette.middleware import Middleware as StarletteMiddleware
 from starlette.routing import (
@@ -270,6 +270,7 @@ class Gateway(StarletteRoute, BaseInterceptorMixin, BaseMiddleware):
         self._interceptors: Union[List["Interceptor"], "VoidType"] = Void
         self.name = name
         self.handler = handler
+        self._openapi_path: Optional[Tuple[str, str]] = None
         self.dependencies = dependencies or {}
         self.interceptors: Sequence["Interceptor"] = interceptors or []
         self.permissions: Sequence["Permission"] = permissions or []
@@ -639,6 +640,7 @@ class WebhookGateway(StarletteRoute, BaseInterceptorMixin):
         self._interceptors: Union[List["Interceptor"], "VoidType"] = Void
         self.name = name
         self.handler = handler
+        self._openapi_path: Optional[Tuple[str, str]] = None
         self.dependencies: Any = {}
         self.interceptors: Sequence["Interceptor"] = []
         self.permissions: Sequence["Permission"] = []
@@ -1108,6 +1108,7 @@ class HTTPHandler(BaseInterceptorMixin, FieldInfoMixin, StarletteRoute):
         self.background = background
         self.signature_model: Optional[Type[SignatureModel]] = None
         self.transformer: Optional[TransformerModel] = None
+        self._flat_params: Optional[Tuple[TransformerModel, List[Any]]] = None
         self.response_description = response_description
         self.responses = responses or {}
         self.content_encoding = content_encoding
@@ -75,6 +75,14 @@ class TransformerModel(ArbitraryExtraBaseModel):
     def get_header_params(self) -> Set[ParamSetting]:
         return self.headers
 
+    def get_all_params(
+        self,
+    ) -> Tuple[Set[ParamSetting], Set[ParamSetting], Set[ParamSetting], Set[ParamSetting]]:
+        """
+        The path, query, cookie and header parameters, in this order.
+        """
+        return self.path_params, self.query_params, self.cookies, self.headers
+
     @classmethod
     def dependency_tree(cls, key: str, dependencies: "Dependencies") -> Dependency:
         inject = dependencies[key]
@@ -1,9 +1,11 @@
 from typing import Dict, List, Union
 
+import pytest
 from pydantic import BaseModel
 
-from esmerald import Gateway, JSONResponse, get
+from esmerald import Esmerald, Gateway, JSONResponse, get
 from esmerald.openapi.datastructures import OpenAPIResponse
+from esmerald.openapi.openapi import get_openapi
 from esmerald.testclient import create_client
 from tests.settings import TestSettings
 
@@ -144,3 +146,17 @@ def test_open_api_schema(test_client_factory):
                 }
             },
         }
+
+
+@pytest.mark.parametrize("validate", [True, False])
+def test_additional_response_has_only_the_response_fields(validate):
+    app = Esmerald(routes=[Gateway(handler=read_item)])
+
+    schema = get_openapi(
+        app=app, title="Esmerald", version="1.0.0", routes=app.routes, validate=validate
+    )
+
+    assert schema["paths"]["/item/{id}"]["get"]["responses"]["422"] == {
+        "description": "Error",
+        "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Error"}}},
+    }
@@ -0,0 +1,52 @@
+from esmerald import Gateway, Header, Query, get
+from esmerald.openapi.openapi import _get_flat_params, get_flat_params
+from esmerald.testclient import create_client
+from tests.settings import TestSettings
+
+
+@get("/items/{item_id}")
+async def read_item(
+    item_id: int,
+    q: str = Query(default="name"),
+    x_token: str = Header(value="X-Token"),
+) -> None:
+    """ """
+
+
+def test_get_flat_params_is_cached(test_client_factory):
+    with create_client(
+        routes=[Gateway(handler=read_item)], settings_config=TestSettings
+    ) as client:
+        handler = client.app.routes[0].handler
+
+        params = get_flat_params(handler)
+
+        assert params == _get_flat_params(handler)
+        assert get_flat_params(handler) is params
+
+
+def test_get_flat_params_recomputed_on_new_transformer(test_client_factory):
+    with create_client(
+        routes=[Gateway(handler=read_item)], settings_config=TestSettings
+    ) as client:
+        handler = client.app.routes[0].handler
+
+        params = get_flat_params(handler)
+        handler.transformer = handler.create_handler_transformer_model()
+
+        assert get_flat_params(handler) is not params
+        assert get_flat_params(handler) == _get_flat_params(handler)
+
+
+def test_get_all_params_keeps_the_openapi_order(test_client_factory):
+    with create_client(
+        routes=[Gateway(handler=read_item)], settings_config=TestSettings
+    ) as client:
+        transformer = client.app.routes[0].handler.transformer
+
+        assert transformer.get_all_params() == (
+            transformer.get_path_params(),
+            transformer.get_query_params(),
+            transformer.get_cookie_params(),
+            transformer.get_header_params(),
+        )
@@ -0,0 +1,226 @@
+import json
+import warnings
+from typing import Dict
+
+import orjson
+import pytest
+from pydantic import AnyUrl
+from pydantic.json_schema import GenerateJsonSchema
+
+from esmerald import APIView, Esmerald, Gateway, Query, get, route
+from esmerald.enums import MediaType
+from esmerald.openapi.openapi import (
+    clean_none_values,
+    get_openapi,
+    get_openapi_bytes,
+    get_openapi_security_schemes,
+)
+from esmerald.openapi.security.api_key import APIKeyInHeader, APIKeyInQuery
+from esmerald.openapi.security.http import Bearer
+
+
+@get("/items/{item_id}")
+async def read_item(item_id: int, q: str = Query(default="name")) -> Dict[str, str]:
+    """ """
+
+
+def test_clean_none_values():
+    value = {"a": None, "b": [{"c": None, "d": 1}], "e": {"f": None}}
+
+    assert clean_none_values(value) == {"b": [{"d": 1}], "e": {}}
+
+
+def test_clean_none_values_returns_json_native_values():
+    value = {MediaType.JSON: {"schema": MediaType.TEXT}, "url": AnyUrl("https://esmerald.dev")}
+
+    assert clean_none_values(value) == {
+        "application/json": {"schema": "text/plain"},
+        "url": "https://esmerald.dev/",
+    }
+
+
+def test_get_openapi_without_validation():
+    app = Esmerald(routes=[Gateway(handler=read_item)])
+
+    schema = get_openapi(
+        app=app, title="Esmerald", version="1.0.0", routes=app.routes, validate=False
+    )
+
+    assert schema["openapi"] == "3.1.0"
+    assert schema["info"] == {"title": "Esmerald", "version": "1.0.0"}
+
+    parameters = schema["paths"]["/items/{item_id}"]["get"]["parameters"]
+    assert {parameter["name"] for parameter in parameters} == {"item_id", "q"}
+    assert all(value is not None for parameter in parameters for value in parameter.values())
+
+
+def test_get_openapi_without_validation_is_json_serializable():
+    app = Esmerald(routes=[Gateway(handler=read_item)])
+
+    schema = get_openapi(
+        app=app,
+        title="Esmerald",
+        version="1.0.0",
+        routes=app.routes,
+        terms_of_service=AnyUrl("https://esmerald.dev/terms"),
+        validate=False,
+    )
+
+    assert schema["info"]["termsOfService"] == "https://esmerald.dev/terms"
+    assert json.loads(json.dumps(schema)) == schema
+
+
+def test_get_openapi_without_validation_matches_the_validated_schema():
+    @get("/secure", security=[APIKeyInHeader(name="X-API-KEY"), Bearer])
+    async def read_secure() -> None:
+        """ """
+
+    app = Esmerald(routes=[Gateway(handler=read_item), Gateway(handler=read_secure)])
+    arguments = {"app": app, "title": "Esmerald", "version": "1.0.0", "routes": app.routes}
+
+    schema = get_openapi(validate=False, **arguments)
+
+    assert "scheme_name" not in schema["components"]["securitySchemes"]["Bearer"]
+    assert schema == get_openapi(**arguments)
+
+
+def test_get_openapi_parameter_example_is_compact_json():
+    @get("/search")
+    async def search(q: str = Query(default="name", examples=["a", "b"])) -> None:
+        """ """
+
+    app = Esmerald(routes=[Gateway(handler=search)])
+
+    schema = get_openapi(app=app, title="Esmerald", version="1.0.0", routes=app.routes)
+
+    assert schema["paths"]["/search"]["get"]["parameters"][0]["example"] == '["a","b"]'
+
+
+def test_get_openapi_with_custom_schema_generator():
+    class CustomGenerateJsonSchema(GenerateJsonSchema):
+        instances = 0
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            CustomGenerateJsonSchema.instances += 1
+
+    app = Esmerald(routes=[Gateway(handler=read_item)])
+
+    for _ in range(2):
+        get_openapi(
+            app=app,
+            title="Esmerald",
+            version="1.0.0",
+            routes=app.routes,
+            schema_generator_class=CustomGenerateJsonSchema,
+        )
+
+    assert CustomGenerateJsonSchema.instances == 2
+
+
+def test_get_openapi_does_not_warn_for_handler_with_many_methods():
+    @route("/items", methods=["GET", "POST"])
+    async def items() -> None:
+        """ """
+
+    app = Esmerald(routes=[Gateway(handler=items)])
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        get_openapi(app=app, title="Esmerald", version="1.0.0", routes=app.routes)
+
+
+def test_get_openapi_warns_duplicate_operation_id():
+    @get("/one", operation_id="read")
+    async def read_one() -> None:
+        """ """
+
+    @get("/two", operation_id="read")
+    async def read_two() -> None:
+        """ """
+
+    app = Esmerald(routes=[Gateway(handler=read_one), Gateway(handler=read_two)])
+
+    with pytest.warns(UserWarning, match="Duplicate Operation ID read"):
+        get_openapi(app=app, title="Esmerald", version="1.0.0", routes=app.routes)
+
+
+def test_get_openapi_security_schemes_with_cache():
+    security_cache = {}
+    api_key = APIKeyInHeader(name="X-API-KEY")
+
+    definitions, security = get_openapi_security_schemes(
+        [APIKeyInQuery, api_key], security_cache=security_cache
+    )
+    cached_definitions, cached_security = get_openapi_security_schemes(
+        [APIKeyInQuery, api_key], security_cache=security_cache
+    )
+
+    assert len(security_cache) == 2
+    assert definitions == cached_definitions
+    assert definitions["APIKeyInQuery"] is cached_definitions["APIKeyInQuery"]
+    assert security[0]["APIKeyInQuery"] is cached_security[0]["APIKeyInQuery"]
+    assert security[1]["APIKeyInHeader"] is api_key
+
+
+def test_get_openapi_bytes():
+    app = Esmerald(routes=[Gateway(handler=read_item)])
+    arguments = {"app": app, "title": "Esmerald", "version": "1.0.0", "routes": app.routes}
+
+    schema = get_openapi_bytes(**arguments)
+
+    assert isinstance(schema, bytes)
+    assert orjson.loads(schema) == get_openapi(**arguments)
+    assert orjson.loads(get_openapi_bytes(validate=False, **arguments)) == get_openapi(
+        validate=False, **arguments
+    )
+
+
+def test_openapi_json_keeps_the_app_schema():
+    app = Esmerald(routes=[Gateway(handler=read_item)])
+
+    content = app.openapi_config.openapi_json(app)
+
+    assert app.openapi_schema is not None
+    assert orjson.loads(content) == app.openapi_schema
+    assert content == get_openapi_bytes(**app.openapi_config.get_openapi_arguments(app))
+
+
+def test_openapi_json_is_cached_until_the_routes_change():
+    app = Esmerald(routes=[Gateway(handler=read_item)], enable_openapi=True)
+
+    content = app.openapi_config.openapi_json(app)
+    schema = app.openapi_schema
+
+    assert app.openapi_config.openapi_json(app) is content
+    assert app.openapi_schema is schema
+
+    app.add_route("/other", handler=read_item)
+
+    assert app.openapi_schema is None
+    assert "/other/items/{item_id}" in orjson.loads(app.openapi_config.openapi_json(app))["paths"]
+
+
+def test_openapi_json_is_rebuilt_after_add_route_without_activate_openapi():
+    app = Esmerald(routes=[Gateway(handler=read_item)], enable_openapi=True)
+    app.openapi_config.openapi_json(app)
+
+    app.add_route("/other", handler=read_item, activate_openapi=False)
+
+    assert "/other/items/{item_id}" in orjson.loads(app.openapi_config.openapi_json(app))["paths"]
+
+
+def test_openapi_json_is_rebuilt_after_add_apiview():
+    class View(APIView):
+        path = "/view"
+
+        @get("/{item_id}")
+        async def read_view(self, item_id: int) -> None:
+            """ """
+
+    app = Esmerald(routes=[Gateway(handler=read_item)], enable_openapi=True)
+    app.openapi_config.openapi_json(app)
+
+    app.add_apiview(Gateway(handler=View))
+
+    assert "/view/{item_id}" in orjson.loads(app.openapi_config.openapi_json(app))["paths"]
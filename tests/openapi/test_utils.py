@@ -1,7 +1,7 @@
 import pytest
 
 from esmerald import status
-from esmerald.openapi.utils import is_status_code_allowed
+from esmerald.openapi.utils import dict_update, dumps_example, is_status_code_allowed
 
 status_codes_allowed = [
     getattr(status, value)
@@ -45,3 +45,24 @@ def test_test_is_status_code_allowed_allowed_code(code):
 @pytest.mark.parametrize("code", status_codes_not_allowed)
 def test_test_is_status_code_not_allowed(code):
     assert not is_status_code_allowed(str(code))
+
+
+def test_dumps_example():
+    assert dumps_example(["foo", 1]) == '["foo",1]'
+    assert dumps_example({1: "foo"}) == '{"1":"foo"}'
+
+
+def test_dict_update():
+    original = {"a": {"b": 1}, "c": [1], "d": 1}
+
+    dict_update(original, {"a": {"e": 2}, "c": [2], "d": 2, "f": 3})
+
+    assert original == {"a": {"b": 1, "e": 2}, "c": [1, 2], "d": 2, "f": 3}
+
+
+def test_dict_update_without_common_keys():
+    original = {"a": {"b": 1}}
+
+    dict_update(original, {"c": {"d": 2}})
+
+    assert original == {"a": {"b": 1}, "c": {"d": 2}}